@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Capture controller traffic into a corpus for offline replay.
+
+Runs every query BuiltXml knows about (SystemData, ControlGroup lists,
+FunctionList and the per-group Mnet getters) plus the integration's own
+poll packets, per group and for all groups in one multi-Mnet request,
+concurrently, and stores each request/response pair with a
+timestamp in a gzip'd JSON-lines corpus. Load it with
+custom_components.mitsubishi_ac.replay.ReplayTransport.
+"""
+import argparse
+import asyncio
+import gzip
+import importlib.util
+import json
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from xml.etree.ElementTree import SubElement
+
+import aiohttp
+
+from check_mitsubishi_ac import BuiltXml, XmlGetMnetRequest, XmlRequest
+
+
+def load_protocol():
+    """Load the integration's protocol constants by file path.
+
+    Importing the package would pull in Home Assistant through its
+    __init__; protocol.py itself only needs the standard library.
+    """
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "custom_components", "mitsubishi_ac", "protocol.py",
+    )
+    spec = importlib.util.spec_from_file_location("mitsubishi_ac_protocol", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+protocol = load_protocol()
+CORPUS_FORMAT = protocol.CORPUS_FORMAT
+CORPUS_VERSION = protocol.CORPUS_VERSION
+POLL_ATTRS = protocol.POLL_ATTRS
+OPTIONAL_ATTRS = protocol.OPTIONAL_ATTRS
+PROBE_ATTRS = protocol.PROBE_ATTRS
+
+
+def static_queries(built):
+    """Return the group-independent getRequests of BuiltXml."""
+    return [value for value in vars(built).values() if isinstance(value, str)]
+
+
+def group_queries(built, group):
+    """Return the per-group Mnet getRequests."""
+    return [
+        built.get_current_drive(group),
+        built.get_current_mode(group),
+        built.get_current_set_temperature(group),
+        built.get_current_temperature(group),
+        XmlGetMnetRequest(group_number=group, list_of_attributes=POLL_ATTRS).built,
+        XmlGetMnetRequest(
+            group_number=group, list_of_attributes=POLL_ATTRS + OPTIONAL_ATTRS
+        ).built,
+        XmlGetMnetRequest(group_number=group, list_of_attributes=PROBE_ATTRS).built,
+    ]
+
+
+def batch_queries(groups):
+    """Return the multi-Mnet getRequests polling all groups at once.
+
+    The controller's answer shows whether its firmware supports them.
+    """
+    if len(groups) < 2:
+        return []
+    requests = []
+    for attrs in (POLL_ATTRS, POLL_ATTRS + OPTIONAL_ATTRS):
+        request = XmlRequest(request_type="get")
+        for group in groups:
+            SubElement(
+                request.xml_database_manager,
+                "Mnet",
+                attrib={"Group": group, **dict.fromkeys(attrs, "*")},
+            )
+        requests.append(request.build_full())
+    return requests
+
+
+def parse_groups(mnet_list_response):
+    """Extract group numbers from a MnetList response."""
+    root = ET.fromstring(mnet_list_response)
+    return [
+        record.get("Group")
+        for record in root.iter("MnetRecord")
+        if record.get("Group") is not None
+    ]
+
+
+class Capture:
+    """Send requests concurrently and record every exchange."""
+
+    def __init__(self, url, out, concurrency):
+        self.url = url
+        self.out = out
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.count = 0
+        self.errors = 0
+
+    async def exchange(self, session, request):
+        async with self.semaphore:
+            started = time.time()
+            t0 = time.perf_counter()
+            try:
+                async with session.post(
+                    self.url, data=request, headers={"Content-Type": "text/xml"}
+                ) as resp:
+                    resp.raise_for_status()
+                    response = await resp.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                self.errors += 1
+                print(f"  error: {err}", file=sys.stderr)
+                return None
+            elapsed = time.perf_counter() - t0
+        record = {
+            "t": round(started, 3),
+            "elapsed": round(elapsed, 4),
+            "request": request,
+            "response": response,
+        }
+        self.out.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.count += 1
+        return response
+
+    async def run_all(self, session, requests):
+        await asyncio.gather(*(self.exchange(session, r) for r in requests))
+
+
+async def capture(args):
+    url = f"http://{args.host}/servlet/MIMEReceiveServlet"
+    built = BuiltXml()
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+
+    with gzip.open(args.output, "wt", encoding="utf-8") as out:
+        header = {
+            "format": CORPUS_FORMAT,
+            "version": CORPUS_VERSION,
+            "host": args.host,
+            "t": round(time.time(), 3),
+        }
+        out.write(json.dumps(header, separators=(",", ":")) + "\n")
+        cap = Capture(url, out, args.concurrency)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            mnet_list = await cap.exchange(session, built.get_mnet_list)
+            if mnet_list is None:
+                print("Could not fetch MnetList, aborting", file=sys.stderr)
+                return 1
+            groups = parse_groups(mnet_list)
+            print(f"POST {url}: {len(groups)} groups")
+
+            for round_number in range(args.rounds):
+                if round_number:
+                    await asyncio.sleep(args.interval)
+                requests = static_queries(built)
+                for group in groups:
+                    requests.extend(group_queries(built, group))
+                requests.extend(batch_queries(groups))
+                t0 = time.perf_counter()
+                await cap.run_all(session, requests)
+                print(
+                    f"Round {round_number + 1}/{args.rounds}: "
+                    f"{len(requests)} requests in "
+                    f"{time.perf_counter() - t0:.2f}s"
+                )
+
+    print(f"Saved {cap.count} exchanges ({cap.errors} errors) to {args.output}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog=__file__)
+    parser.add_argument("host", help="Hostname or address of the AC IP controller")
+    parser.add_argument(
+        "-o", "--output", default="mitsubishi_ac_capture.jsonl.gz",
+        help="Corpus file to write",
+    )
+    parser.add_argument(
+        "-r", "--rounds", type=int, default=1,
+        help="Number of times to run the full query set",
+    )
+    parser.add_argument(
+        "-i", "--interval", type=float, default=30.0,
+        help="Seconds between rounds",
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=4,
+        help="Maximum requests in flight",
+    )
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=10.0,
+        help="Per-request timeout in seconds",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(capture(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,36 @@
 
 from __future__ import annotations
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .controller import MitsubishiACController
+from .const import (
+    CONF_CAPABILITIES,
+    CONF_GROUP_TIMEOUT,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_GROUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DOMAIN,
+)
+from .controller import ControllerCapabilities, MitsubishiACController
 from .coordinator import MitsubishiACCoordinator
+from .services import async_setup_services
+
+PLATFORMS = [Platform.BINARY_SENSOR, Platform.CLIMATE, Platform.SENSOR]
 
-PLATFORMS = [Platform.CLIMATE]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Mitsubishi AC services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -19,7 +40,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     groups = entry.data["groups"]
 
     controller = MitsubishiACController(host)
-    coordinator = MitsubishiACCoordinator(hass, controller, groups)
+
+    if CONF_CAPABILITIES in entry.data:
+        capabilities = ControllerCapabilities.from_dict(
+            entry.data[CONF_CAPABILITIES]
+        )
+    else:
+        try:
+            async with aiohttp.ClientSession() as session:
+                capabilities = await controller.async_probe_capabilities(
+                    session,
+                    list(groups),
+                    entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+                    entry.options.get(CONF_GROUP_TIMEOUT, DEFAULT_GROUP_TIMEOUT),
+                )
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise ConfigEntryNotReady(
+                f"Error probing controller capabilities: {err}"
+            ) from err
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_CAPABILITIES: capabilities.as_dict()},
+        )
+
+    coordinator = MitsubishiACCoordinator(hass, controller, groups, capabilities)
 
     await coordinator.async_config_entry_first_refresh()
 
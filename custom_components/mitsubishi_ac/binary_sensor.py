@@ -0,0 +1,92 @@
+"""Binary sensor platform for Mitsubishi AC."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .controller import GroupState
+from .coordinator import MitsubishiACCoordinator
+from .entity import MitsubishiACEntity
+
+
+@dataclass(frozen=True, kw_only=True)
+class MitsubishiACBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a binary sensor read from a polled Mnet attribute."""
+
+    attribute: str
+    value_fn: Callable[[GroupState], bool | None]
+
+
+BINARY_SENSORS: tuple[MitsubishiACBinarySensorEntityDescription, ...] = (
+    MitsubishiACBinarySensorEntityDescription(
+        key="filter",
+        translation_key="filter",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        attribute="FilterSign",
+        value_fn=lambda state: state.filter_sign,
+    ),
+    MitsubishiACBinarySensorEntityDescription(
+        key="error",
+        translation_key="error",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        attribute="ErrorSign",
+        value_fn=lambda state: state.error_sign,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up binary sensor entities from a config entry."""
+    coordinator: MitsubishiACCoordinator = entry.runtime_data
+    entities = [
+        MitsubishiACBinarySensor(coordinator, group, name, description)
+        for group, name in coordinator.groups.items()
+        for description in BINARY_SENSORS
+        if description.attribute
+        in coordinator.capabilities.for_group(group).attributes
+    ]
+    async_add_entities(entities)
+
+
+class MitsubishiACBinarySensor(MitsubishiACEntity, BinarySensorEntity):
+    """Binary sensor for a single sign of a Mitsubishi AC group."""
+
+    entity_description: MitsubishiACBinarySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: MitsubishiACCoordinator,
+        group: str,
+        name: str,
+        description: MitsubishiACBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, group, name)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{group}_{description.key}"
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true if the sign is raised."""
+        state = self._state
+        if state is None:
+            return None
+        return self.entity_description.value_fn(state)
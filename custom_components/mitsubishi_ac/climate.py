@@ -12,8 +12,9 @@ from homeassistant.components.climate import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util.unit_conversion import TemperatureConverter
 
 from .const import (
     DOMAIN,
@@ -25,7 +26,7 @@ from .const import (
     TEMP_STEP,
 )
 from .coordinator import MitsubishiACCoordinator
-from .controller import GroupState
+from .entity import MitsubishiACEntity
 
 
 async def async_setup_entry(
@@ -42,39 +43,45 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class MitsubishiACClimate(
-    CoordinatorEntity[MitsubishiACCoordinator], ClimateEntity
-):
+class MitsubishiACClimate(MitsubishiACEntity, ClimateEntity):
     """Climate entity for a single Mitsubishi AC group."""
 
-    _attr_has_entity_name = True
-    _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _attr_supported_features = (
-        ClimateEntityFeature.TARGET_TEMPERATURE
-        | ClimateEntityFeature.TURN_ON
-        | ClimateEntityFeature.TURN_OFF
-    )
-    _attr_hvac_modes = SUPPORTED_HVAC_MODES
-    _attr_min_temp = MIN_TEMP
-    _attr_max_temp = MAX_TEMP
-    _attr_target_temperature_step = TEMP_STEP
+    _attr_name = None
     _enable_turn_on_off_backwards_compat = False
 
     def __init__(
         self, coordinator: MitsubishiACCoordinator, group: str, name: str
     ) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
-        self._group = group
+        super().__init__(coordinator, group, name)
         self._attr_unique_id = f"{DOMAIN}_{group}"
-        self._attr_name = name if name else f"AC Group {group}"
 
-    @property
-    def _state(self) -> GroupState | None:
-        """Get the current state from coordinator data."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(self._group)
+        if coordinator.capabilities.fahrenheit:
+            unit = UnitOfTemperature.FAHRENHEIT
+            self._attr_target_temperature_step = 1.0
+        else:
+            unit = UnitOfTemperature.CELSIUS
+            self._attr_target_temperature_step = TEMP_STEP
+        self._attr_temperature_unit = unit
+
+        caps = coordinator.capabilities.for_group(group)
+        features = ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+        if "SetTemp" in caps.attributes:
+            features |= ClimateEntityFeature.TARGET_TEMPERATURE
+        self._attr_supported_features = features
+        group_modes = {MODE_TO_HVAC[mode] for mode in caps.modes}
+        self._attr_hvac_modes = [
+            mode
+            for mode in SUPPORTED_HVAC_MODES
+            if mode == HVACMode.OFF or mode in group_modes
+        ]
+        # Probed limits are in the controller's unit, the defaults in °C
+        self._attr_min_temp = caps.min_temp or TemperatureConverter.convert(
+            MIN_TEMP, UnitOfTemperature.CELSIUS, unit
+        )
+        self._attr_max_temp = caps.max_temp or TemperatureConverter.convert(
+            MAX_TEMP, UnitOfTemperature.CELSIUS, unit
+        )
 
     @property
     def hvac_mode(self) -> HVACMode | None:
@@ -111,8 +118,10 @@ class MitsubishiACClimate(
                 )
             else:
                 mode = HVAC_TO_MODE.get(hvac_mode)
-                if mode is None:
-                    return
+                if mode is None or hvac_mode not in self.hvac_modes:
+                    raise ServiceValidationError(
+                        f"{self.entity_id} does not support HVAC mode {hvac_mode}"
+                    )
                 # Turn on if currently off, then set mode
                 state = self._state
                 if state and state.drive == "OFF":
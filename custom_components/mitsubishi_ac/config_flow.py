@@ -8,10 +8,22 @@ from typing import Any
 import aiohttp
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
 
-from .const import DOMAIN
+from .const import (
+    CONF_GROUP_TIMEOUT,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_GROUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DOMAIN,
+)
 from .controller import MitsubishiACController
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +40,12 @@ class MitsubishiACConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return MitsubishiACOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -66,3 +84,35 @@ class MitsubishiACConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class MitsubishiACOptionsFlow(OptionsFlow):
+    """Handle options for Mitsubishi AC."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the per-group polling options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MAX_CONCURRENCY,
+                        default=options.get(
+                            CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Required(
+                        CONF_GROUP_TIMEOUT,
+                        default=options.get(
+                            CONF_GROUP_TIMEOUT, DEFAULT_GROUP_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+                }
+            ),
+        )
@@ -4,10 +4,30 @@ from homeassistant.components.climate import HVACMode
 
 DOMAIN = "mitsubishi_ac"
 
+CONF_CAPABILITIES = "capabilities"
+CONF_MAX_CONCURRENCY = "max_concurrent_requests"
+CONF_GROUP_TIMEOUT = "group_timeout"
+
 DEFAULT_PORT = 80
 ENDPOINT_PATH = "/servlet/MIMEReceiveServlet"
 SCAN_INTERVAL_SECONDS = 30
 
+# Per-group polling, for firmware without multi-Mnet support
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_GROUP_TIMEOUT = 10
+# The multi-Mnet request answers for all groups, so it may take longer
+BATCH_TIMEOUT_FACTOR = 3
+# Failed multi-Mnet requests in a row, with per-group requests answering,
+# before the controller is polled per group only
+MAX_BATCH_FAILURES = 3
+# Polls in a row a group may miss before its entities become unavailable
+MAX_GROUP_MISSES = 3
+
+# Samples kept per group: 24 h at poll resolution
+HISTORY_CAPACITY = 24 * 3600 // SCAN_INTERVAL_SECONDS
+# Window used for the rate of change / time-to-setpoint estimates
+TREND_WINDOW_SECONDS = 15 * 60
+
 # Controller mode -> HA HVACMode
 MODE_TO_HVAC: dict[str, HVACMode] = {
     "COOL": HVACMode.COOL,
@@ -2,12 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Any, TypeVar
 
 import aiohttp
 
-from .const import ENDPOINT_PATH
+from .const import DEFAULT_GROUP_TIMEOUT, DEFAULT_MAX_CONCURRENCY, ENDPOINT_PATH
+from .profiler import PollProfiler
+from .protocol import (
+    BASE_MODES,
+    MODE_SWITCHES,
+    OPTIONAL_ATTRS,
+    POLL_ATTRS,
+    PROBE_ATTRS,
+    TEMP_MAX_ATTRS,
+    TEMP_MIN_ATTRS,
+)
+
+_T = TypeVar("_T")
+
+Transport = Callable[[str], Awaitable[str]]
+"""Alternative to HTTP: takes a request packet, returns the response text."""
 
 
 @dataclass
@@ -27,6 +46,55 @@ class GroupState:
     mode: str  # COOL, HEAT, DRY, FAN, AUTO, ...
     set_temp: float | None
     inlet_temp: float | None
+    fan_speed: str | None = None  # LOW, MID2, MID1, HIGH, AUTO, ...
+    air_direction: str | None = None  # SWING, VERTICAL, MID2, ...
+    filter_sign: bool | None = None
+    error_sign: bool | None = None
+    error_code: str | None = None
+
+
+@dataclass
+class GroupCapabilities:
+    """What a single AC group supports."""
+
+    attributes: list[str] = field(default_factory=lambda: list(POLL_ATTRS))
+    modes: list[str] = field(
+        default_factory=lambda: [*BASE_MODES, *MODE_SWITCHES]
+    )
+    min_temp: float | None = None
+    max_temp: float | None = None
+
+
+@dataclass
+class ControllerCapabilities:
+    """Result of the capability probe, stored in the config entry."""
+
+    system: dict[str, str] = field(default_factory=dict)
+    groups: dict[str, GroupCapabilities] = field(default_factory=dict)
+
+    @property
+    def fahrenheit(self) -> bool:
+        """Return whether the controller reports temperatures in °F."""
+        return self.system.get("TempUnit", "").upper().startswith("F")
+
+    def for_group(self, group: str) -> GroupCapabilities:
+        """Return the capabilities of a group, defaulting to everything."""
+        return self.groups.get(group) or GroupCapabilities()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for storage in the config entry."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ControllerCapabilities:
+        """Restore from config entry data."""
+        return cls(
+            system=dict(data.get("system", {})),
+            groups={
+                group: GroupCapabilities(**caps)
+                for group, caps in data.get("groups", {}).items()
+            },
+        )
 
 
 def _build_xml(command: str, inner_xml: str) -> str:
@@ -45,6 +113,17 @@ def _build_get_mnet(group: str, attrs: list[str]) -> str:
     return _build_xml("getRequest", inner)
 
 
+def _build_get_mnet_many(attrs_by_group: dict[str, list[str]]) -> str:
+    """Build a single getRequest for the Mnet attributes of many groups."""
+    inner = "".join(
+        f'<Mnet Group="{group}" '
+        + " ".join(f'{a}="*"' for a in attrs)
+        + " />"
+        for group, attrs in attrs_by_group.items()
+    )
+    return _build_xml("getRequest", inner)
+
+
 def _build_set_mnet(group: str, attrs: dict[str, str]) -> str:
     """Build a setRequest for Mnet attributes."""
     attr_str = " ".join(f'{k}="{v}"' for k, v in attrs.items())
@@ -61,6 +140,67 @@ def _parse_mnet_attrs(xml_text: str) -> dict[str, str]:
     return dict(mnet.attrib)
 
 
+def _group_capabilities(attrs: dict[str, str]) -> GroupCapabilities:
+    """Derive group capabilities from a probe response.
+
+    Anything the controller does not report keeps the default, so groups
+    on models without these attributes behave as before.
+    """
+    if not attrs:
+        return GroupCapabilities()
+    reported = {k for k, v in attrs.items() if v not in ("", "*")}
+    polled = [a for a in (*POLL_ATTRS, *OPTIONAL_ATTRS) if a in reported]
+    if "Drive" not in polled:
+        polled = list(POLL_ATTRS)
+    modes = list(BASE_MODES)
+    modes.extend(
+        mode
+        for mode, switch in MODE_SWITCHES.items()
+        if attrs.get(switch) != "DISABLE"
+    )
+    mins = [_safe_float(attrs.get(a)) for a in TEMP_MIN_ATTRS]
+    maxs = [_safe_float(attrs.get(a)) for a in TEMP_MAX_ATTRS]
+    mins = [t for t in mins if t is not None]
+    maxs = [t for t in maxs if t is not None]
+    return GroupCapabilities(
+        attributes=polled,
+        modes=modes,
+        min_temp=min(mins) if mins else None,
+        max_temp=max(maxs) if maxs else None,
+    )
+
+
+def _parse_group_state(group: str, xml_text: str) -> GroupState:
+    """Parse a group state from an Mnet getResponse."""
+    return _group_state(group, _parse_mnet_attrs(xml_text))
+
+
+def _parse_group_states(xml_text: str) -> dict[str, GroupState]:
+    """Parse the state of every group in a multi-Mnet getResponse."""
+    root = ET.fromstring(xml_text)
+    return {
+        group: _group_state(group, mnet.attrib)
+        for mnet in root.iter("Mnet")
+        if (group := mnet.get("Group")) is not None
+    }
+
+
+def _group_state(group: str, attrs: dict[str, str]) -> GroupState:
+    """Build a group state from Mnet attributes."""
+    return GroupState(
+        group=group,
+        drive=attrs.get("Drive", "OFF"),
+        mode=attrs.get("Mode", "AUTO"),
+        set_temp=_safe_float(attrs.get("SetTemp")),
+        inlet_temp=_safe_float(attrs.get("InletTemp")),
+        fan_speed=attrs.get("FanSpeed"),
+        air_direction=attrs.get("AirDirection"),
+        filter_sign=_safe_bool(attrs.get("FilterSign")),
+        error_sign=_safe_bool(attrs.get("ErrorSign")),
+        error_code=attrs.get("ErrorCode"),
+    )
+
+
 def _safe_float(value: str | None) -> float | None:
     """Convert a string to float, returning None on failure."""
     if value is None:
@@ -71,15 +211,64 @@ def _safe_float(value: str | None) -> float | None:
         return None
 
 
+def _safe_bool(value: str | None) -> bool | None:
+    """Convert an ON/OFF string to bool, returning None otherwise."""
+    if value == "ON":
+        return True
+    if value == "OFF":
+        return False
+    return None
+
+
 class MitsubishiACController:
     """Async controller client for Mitsubishi AC."""
 
-    def __init__(self, host: str, port: int = 80) -> None:
-        """Initialize the controller."""
+    def __init__(
+        self, host: str, port: int = 80, transport: Transport | None = None
+    ) -> None:
+        """Initialize the controller.
+
+        If transport is given, packets are handed to it instead of being
+        POSTed to the controller (e.g. a ReplayTransport for offline runs).
+        """
         self._base_url = f"http://{host}:{port}{ENDPOINT_PATH}"
+        self._transport = transport
+        # request packet -> (hash of last raw response, parsed result)
+        self._fingerprints: dict[str, tuple[int, object]] = {}
+        self.fingerprint_hits = 0
+        self.fingerprint_misses = 0
+        # Set only while a profile is running
+        self.profiler: PollProfiler | None = None
+
+    @property
+    def fingerprint_hit_ratio(self) -> float | None:
+        """Return the share of responses that matched the previous one."""
+        total = self.fingerprint_hits + self.fingerprint_misses
+        if not total:
+            return None
+        return self.fingerprint_hits / total
+
+    def _phase(self, name: str) -> AbstractContextManager[None]:
+        """Time a block as a profiler phase, if a profile is running."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
+
+    def _profiling(self) -> AbstractContextManager[None]:
+        """Run cProfile for a block, if a profile is running."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.profiling()
 
     async def _post(self, session: aiohttp.ClientSession, data: str) -> str:
         """Send a POST request to the controller."""
+        with self._phase("network"):
+            return await self._send(session, data)
+
+    async def _send(self, session: aiohttp.ClientSession, data: str) -> str:
+        """Hand a packet to the transport or POST it to the controller."""
+        if self._transport is not None:
+            return await self._transport(data)
         async with session.post(
             self._base_url,
             data=data,
@@ -88,43 +277,150 @@ class MitsubishiACController:
             resp.raise_for_status()
             return await resp.text()
 
+    def _parse_cached(
+        self, request: str, response: str, parse: Callable[[str], _T]
+    ) -> tuple[_T, bool]:
+        """Parse a response unless it is identical to the previous one.
+
+        Returns the parsed result and whether it changed. When the raw
+        response to a request matches the last one byte for byte, the
+        previously parsed result is returned as is.
+        """
+        fingerprint = hash(response)
+        cached = self._fingerprints.get(request)
+        if cached is not None and cached[0] == fingerprint:
+            self.fingerprint_hits += 1
+            return cached[1], False  # type: ignore[return-value]
+        self.fingerprint_misses += 1
+        result = parse(response)
+        self._fingerprints[request] = (fingerprint, result)
+        return result, True
+
+    async def async_poll_group_state(
+        self,
+        session: aiohttp.ClientSession,
+        group: str,
+        attrs: list[str] | None = None,
+    ) -> tuple[GroupState, bool]:
+        """Get the state of a group and whether it changed since last poll.
+
+        attrs limits the request to the attributes the group supports.
+        """
+        with self._phase("build"):
+            xml = _build_get_mnet(group, attrs or POLL_ATTRS)
+        return await self._async_poll(
+            session, xml, lambda text: _parse_group_state(group, text)
+        )
+
+    async def async_poll_group_states(
+        self,
+        session: aiohttp.ClientSession,
+        attrs_by_group: dict[str, list[str]],
+    ) -> tuple[dict[str, GroupState], bool]:
+        """Get the state of many groups with one multi-Mnet request.
+
+        Returns the groups found in the response, which may be fewer than
+        requested on firmware without multi-Mnet support, and whether the
+        response changed since last poll.
+        """
+        with self._phase("build"):
+            xml = _build_get_mnet_many(attrs_by_group)
+        return await self._async_poll(session, xml, _parse_group_states)
+
+    async def _async_poll(
+        self,
+        session: aiohttp.ClientSession,
+        xml: str,
+        parse: Callable[[str], _T],
+    ) -> tuple[_T, bool]:
+        """Send a poll request and parse the response if it changed."""
+        response = await self._post(session, xml)
+        with self._phase("parse"):
+            return self._parse_cached(xml, response, parse)
+
     async def async_get_group_state(
         self, session: aiohttp.ClientSession, group: str
     ) -> GroupState:
         """Get the full state of a group."""
-        xml = _build_get_mnet(
-            group, ["Drive", "Mode", "SetTemp", "InletTemp"]
-        )
-        response = await self._post(session, xml)
-        attrs = _parse_mnet_attrs(response)
-        return GroupState(
-            group=group,
-            drive=attrs.get("Drive", "OFF"),
-            mode=attrs.get("Mode", "AUTO"),
-            set_temp=_safe_float(attrs.get("SetTemp")),
-            inlet_temp=_safe_float(attrs.get("InletTemp")),
+        state, _ = await self.async_poll_group_state(session, group)
+        return state
+
+    async def async_probe_capabilities(
+        self,
+        session: aiohttp.ClientSession,
+        groups: list[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_GROUP_TIMEOUT,
+    ) -> ControllerCapabilities:
+        """Probe what the controller and each group support.
+
+        Reads the controller's SystemData (temperature unit, model and
+        version) once, then asks every group for the optional Mnet
+        attributes, a few groups at a time with a timeout per request.
+        A request the controller rejects leaves the defaults in place.
+        """
+        caps = ControllerCapabilities()
+        root = await self._async_probe(
+            session,
+            _build_xml(
+                "getRequest",
+                '<SystemData Version="*" TempUnit="*" Model="*" />',
+            ),
         )
+        system = None if root is None else root.find(".//SystemData")
+        if system is not None:
+            caps.system = dict(system.attrib)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def probe(group: str) -> GroupCapabilities:
+            async with semaphore, asyncio.timeout(timeout):
+                root = await self._async_probe(
+                    session, _build_get_mnet(group, PROBE_ATTRS)
+                )
+            mnet = None if root is None else root.find(".//Mnet")
+            return _group_capabilities({} if mnet is None else dict(mnet.attrib))
+
+        results = await asyncio.gather(*(probe(group) for group in groups))
+        caps.groups = dict(zip(groups, results))
+        return caps
+
+    async def _async_probe(
+        self, session: aiohttp.ClientSession, xml: str
+    ) -> ET.Element | None:
+        """Send a probe request, returning None if it is rejected."""
+        try:
+            response = await self._post(session, xml)
+        except aiohttp.ClientResponseError:
+            return None
+        try:
+            return ET.fromstring(response)
+        except ET.ParseError:
+            return None
 
     async def async_set_drive(
         self, session: aiohttp.ClientSession, group: str, value: str
     ) -> None:
         """Set the drive (ON/OFF) for a group."""
-        xml = _build_set_mnet(group, {"Drive": value})
-        await self._post(session, xml)
+        await self._async_set(session, group, {"Drive": value})
 
     async def async_set_mode(
         self, session: aiohttp.ClientSession, group: str, value: str
     ) -> None:
         """Set the mode for a group."""
-        xml = _build_set_mnet(group, {"Mode": value})
-        await self._post(session, xml)
+        await self._async_set(session, group, {"Mode": value})
 
     async def async_set_temperature(
         self, session: aiohttp.ClientSession, group: str, value: float
     ) -> None:
         """Set the target temperature for a group."""
-        xml = _build_set_mnet(group, {"SetTemp": str(value)})
-        await self._post(session, xml)
+        await self._async_set(session, group, {"SetTemp": str(value)})
+
+    async def _async_set(
+        self, session: aiohttp.ClientSession, group: str, attrs: dict[str, str]
+    ) -> None:
+        """Send a setRequest for a group."""
+        with self._profiling():
+            await self._post(session, _build_set_mnet(group, attrs))
 
     async def async_discover_groups(
         self, session: aiohttp.ClientSession
@@ -2,16 +2,39 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 import logging
+import time
+from typing import Any
+import xml.etree.ElementTree as ET
 
 import aiohttp
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, SCAN_INTERVAL_SECONDS
-from .controller import GroupState, MitsubishiACController
+from .const import (
+    BATCH_TIMEOUT_FACTOR,
+    CONF_GROUP_TIMEOUT,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_GROUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DOMAIN,
+    HISTORY_CAPACITY,
+    MAX_BATCH_FAILURES,
+    MAX_GROUP_MISSES,
+    SCAN_INTERVAL_SECONDS,
+)
+from .controller import (
+    ControllerCapabilities,
+    GroupState,
+    MitsubishiACController,
+)
+from .history import GroupHistory
+from .profiler import PollProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +47,7 @@ class MitsubishiACCoordinator(DataUpdateCoordinator[dict[str, GroupState]]):
         hass: HomeAssistant,
         controller: MitsubishiACController,
         groups: dict[str, str],
+        capabilities: ControllerCapabilities,
     ) -> None:
         """Initialize the coordinator.
 
@@ -34,20 +58,252 @@ class MitsubishiACCoordinator(DataUpdateCoordinator[dict[str, GroupState]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=SCAN_INTERVAL_SECONDS),
+            # Unchanged polls return the same data; don't notify entities
+            always_update=False,
         )
         self.controller = controller
         self.groups = groups
+        self.capabilities = capabilities
+        self.history: dict[str, GroupHistory] = {
+            group: GroupHistory(HISTORY_CAPACITY) for group in groups
+        }
+        # Polls in a row each group did not answer
+        self._misses: dict[str, int] = dict.fromkeys(groups, 0)
+        # None until the first poll tells whether multi-Mnet requests work
+        self.multi_mnet: bool | None = None
+        # Failed multi-Mnet requests in a row that per-group polling covered
+        self._batch_failures = 0
+
+    @property
+    def _options(self) -> Mapping[str, Any]:
+        """Return the entry options, empty when not set up from an entry."""
+        return self.config_entry.options if self.config_entry else {}
 
     async def _async_update_data(self) -> dict[str, GroupState]:
-        """Fetch state for all groups."""
-        data: dict[str, GroupState] = {}
+        """Fetch state for all groups, profiling the cycle if asked to."""
+        profiler = self.controller.profiler
+        if profiler is None:
+            return await self._async_poll_all()
+        try:
+            with profiler.cycle():
+                return await self._async_poll_all()
+        finally:
+            # Failed polls count too, so a profile ends while the
+            # controller is unreachable
+            if profiler.cycle_done():
+                # Runs after this refresh has dispatched to the listeners
+                self.hass.async_create_task(self._async_finish_profile(profiler))
+
+    async def _async_poll_all(self) -> dict[str, GroupState]:
+        """Poll all groups.
+
+        All groups are read with one multi-Mnet request. Groups missing
+        from its response, or all groups when it fails or the firmware
+        rejects it, are read with one request each, concurrently. Groups
+        that do not
+        answer in time keep their last known state for a few polls, then
+        are left out so their entities become unavailable.
+        """
         try:
             async with aiohttp.ClientSession() as session:
-                for group in self.groups:
-                    state = await self.controller.async_get_group_state(
-                        session, group
-                    )
-                    data[group] = state
+                batch = await self._async_poll_batch(session)
+                data, changed = batch or ({}, False)
+                missing = [group for group in self.groups if group not in data]
+                if missing:
+                    try:
+                        fetched, fetched_changed = await self._async_poll_groups(
+                            session, missing
+                        )
+                    except (aiohttp.ClientError, TimeoutError):
+                        if not data:
+                            raise
+                        # The batch answered; the rest count as missed
+                        fetched, fetched_changed = {}, False
+                    data.update(fetched)
+                    changed |= fetched_changed
         except (aiohttp.ClientError, TimeoutError) as err:
-            raise UpdateFailed(f"Error communicating with controller: {err}") from err
+            raise UpdateFailed(
+                "Error communicating with controller: "
+                f"{str(err) or type(err).__name__}"
+            ) from err
+        if batch is None and data:
+            self._batch_failed()
+        now = time.time()
+        for group, state in data.items():
+            self.history[group].append(now, state)
+        changed |= self._keep_stale_groups(data)
+        _LOGGER.debug(
+            "Poll %s, fingerprint hit ratio %s",
+            "changed" if changed else "unchanged",
+            self.controller.fingerprint_hit_ratio,
+        )
+        if not changed and self.data is not None:
+            return self.data
         return data
+
+    def _keep_stale_groups(self, data: dict[str, GroupState]) -> bool:
+        """Fill in groups that did not answer from the previous poll.
+
+        Returns whether the set of groups with a state changed.
+        """
+        previous = self.data or {}
+        for group in self.groups:
+            if group in data:
+                if self._misses[group] >= MAX_GROUP_MISSES:
+                    _LOGGER.info("Group %s is answering again", group)
+                self._misses[group] = 0
+                continue
+            self._misses[group] += 1
+            if self._misses[group] == MAX_GROUP_MISSES:
+                _LOGGER.warning(
+                    "Group %s did not answer %s polls in a row, "
+                    "marking it unavailable",
+                    group,
+                    MAX_GROUP_MISSES,
+                )
+            if self._misses[group] < MAX_GROUP_MISSES and group in previous:
+                data[group] = previous[group]
+        return self.data is not None and data.keys() != previous.keys()
+
+    def _batch_failed(self) -> None:
+        """Count a failed multi-Mnet request that per-group polling covered."""
+        self._batch_failures += 1
+        if self._batch_failures >= MAX_BATCH_FAILURES:
+            _LOGGER.warning(
+                "Multi-Mnet requests failed %s polls in a row, "
+                "polling groups individually",
+                self._batch_failures,
+            )
+            self.multi_mnet = False
+
+    async def _async_poll_batch(
+        self, session: aiohttp.ClientSession
+    ) -> tuple[dict[str, GroupState], bool] | None:
+        """Poll all groups with one multi-Mnet request, if supported.
+
+        Returns None when the request failed or timed out, so this poll
+        falls back to per-group requests. Multi-Mnet is turned off when a
+        parsed response left out the extra groups, or after a few failed
+        requests in a row while per-group requests answered.
+        """
+        if self.multi_mnet is False or len(self.groups) < 2:
+            return {}, False
+        attrs_by_group = {
+            group: self.capabilities.for_group(group).attributes
+            for group in self.groups
+        }
+        timeout = (
+            self._options.get(CONF_GROUP_TIMEOUT, DEFAULT_GROUP_TIMEOUT)
+            * BATCH_TIMEOUT_FACTOR
+        )
+        try:
+            async with asyncio.timeout(timeout):
+                states, changed = await self.controller.async_poll_group_states(
+                    session, attrs_by_group
+                )
+        except (aiohttp.ClientError, ET.ParseError, TimeoutError) as err:
+            _LOGGER.debug(
+                "Multi-Mnet request failed, polling groups individually: %s",
+                str(err) or type(err).__name__,
+            )
+            return None
+        if len(states) < 2 and not self.multi_mnet:
+            # Only a parsed answer tells the firmware ignores extra groups
+            _LOGGER.warning(
+                "Controller does not support multi-Mnet requests, "
+                "polling groups individually"
+            )
+            self.multi_mnet = False
+            return {}, False
+        self.multi_mnet = True
+        self._batch_failures = 0
+        # The parsed result may be cached by the controller; don't mutate it
+        return dict(states), changed
+
+    async def _async_poll_groups(
+        self, session: aiohttp.ClientSession, groups: list[str]
+    ) -> tuple[dict[str, GroupState], bool]:
+        """Poll groups one request each, a few at a time.
+
+        Groups that fail or time out are left out. Raises the first error
+        if no group answered.
+        """
+        semaphore = asyncio.Semaphore(
+            self._options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
+        )
+        timeout = self._options.get(CONF_GROUP_TIMEOUT, DEFAULT_GROUP_TIMEOUT)
+
+        async def poll(group: str) -> tuple[GroupState, bool]:
+            async with semaphore, asyncio.timeout(timeout):
+                return await self.controller.async_poll_group_state(
+                    session, group, self.capabilities.for_group(group).attributes
+                )
+
+        results = await asyncio.gather(
+            *(poll(group) for group in groups), return_exceptions=True
+        )
+        data: dict[str, GroupState] = {}
+        changed = False
+        errors: list[BaseException] = []
+        for group, result in zip(groups, results):
+            if isinstance(result, (aiohttp.ClientError, TimeoutError)):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                data[group], group_changed = result
+                changed |= group_changed
+        if errors and not data:
+            raise errors[0]
+        if errors:
+            _LOGGER.debug(
+                "%s of %s groups did not answer: %s",
+                len(errors),
+                len(groups),
+                str(errors[0]) or type(errors[0]).__name__,
+            )
+        return data, changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners."""
+        profiler = self.controller.profiler
+        if profiler is None:
+            super().async_update_listeners()
+            return
+        with profiler.profiling(), profiler.phase("dispatch"):
+            super().async_update_listeners()
+
+    @callback
+    def async_start_profile(self, cycles: int) -> None:
+        """Profile the next poll cycles and the commands sent meanwhile."""
+        if self.controller.profiler is not None:
+            raise HomeAssistantError("A profile is already running")
+        try:
+            self.controller.profiler = PollProfiler(cycles)
+        except ValueError as err:
+            # Another profiler is active on the event loop thread
+            raise HomeAssistantError(f"Cannot start profiler: {err}") from err
+        _LOGGER.info("Profiling the next %s poll cycles", cycles)
+
+    async def async_shutdown(self) -> None:
+        """Cancel polling and finish a running profile early."""
+        await super().async_shutdown()
+        if (profiler := self.controller.profiler) is not None:
+            await self._async_finish_profile(profiler)
+
+    async def _async_finish_profile(self, profiler: PollProfiler) -> None:
+        """Stop the profiler and write its results to the config dir."""
+        await asyncio.sleep(0)
+        if self.controller.profiler is not profiler:
+            # Already finished by a shutdown
+            return
+        self.controller.profiler = None
+        profiler.stop()
+        base_path = self.hass.config.path(
+            f"{DOMAIN}_profile_{datetime.now():%Y%m%d_%H%M%S}"
+        )
+        stats_path, summary_path = await self.hass.async_add_executor_job(
+            profiler.write, base_path
+        )
+        _LOGGER.info("Profile written to %s and %s", stats_path, summary_path)
@@ -0,0 +1,52 @@
+"""Diagnostics support for Mitsubishi AC."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import HISTORY_CAPACITY, SCAN_INTERVAL_SECONDS
+from .coordinator import MitsubishiACCoordinator
+from .history import summarize
+
+TO_REDACT = {CONF_HOST}
+
+# Points per group in the downloaded series (5 min resolution over 24 h)
+DIAGNOSTICS_POINTS = 288
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: MitsubishiACCoordinator = entry.runtime_data
+    controller = coordinator.controller
+    now = time.time()
+    data = coordinator.data or {}
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "controller": {
+            "fingerprint_hits": controller.fingerprint_hits,
+            "fingerprint_misses": controller.fingerprint_misses,
+            "fingerprint_hit_ratio": controller.fingerprint_hit_ratio,
+        },
+        "groups": {
+            group: {
+                "state": asdict(data[group]) if group in data else None,
+                "history_bytes": history.nbytes,
+                "history": summarize(
+                    history,
+                    now,
+                    HISTORY_CAPACITY * SCAN_INTERVAL_SECONDS,
+                    DIAGNOSTICS_POINTS,
+                ),
+            }
+            for group, history in coordinator.history.items()
+        },
+    }
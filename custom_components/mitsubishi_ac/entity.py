@@ -0,0 +1,47 @@
+"""Base entity for Mitsubishi AC."""
+
+from __future__ import annotations
+
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .controller import GroupState
+from .coordinator import MitsubishiACCoordinator
+
+
+def device_identifier(entry_id: str, group: str) -> tuple[str, str]:
+    """Return the device registry identifier of an AC group."""
+    return (DOMAIN, f"{entry_id}_{group}")
+
+
+class MitsubishiACEntity(CoordinatorEntity[MitsubishiACCoordinator]):
+    """Entity reading a single AC group from the shared coordinator poll."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self, coordinator: MitsubishiACCoordinator, group: str, name: str
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._group = group
+        self._attr_device_info = DeviceInfo(
+            identifiers={
+                device_identifier(coordinator.config_entry.entry_id, group)
+            },
+            name=name if name else f"AC Group {group}",
+            manufacturer="Mitsubishi Electric",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return whether the group answered recent polls."""
+        return super().available and self._state is not None
+
+    @property
+    def _state(self) -> GroupState | None:
+        """Get the current state from coordinator data."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get(self._group)
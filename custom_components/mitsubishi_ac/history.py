@@ -0,0 +1,181 @@
+"""In-memory sample history for Mitsubishi AC groups."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from datetime import UTC, datetime
+import math
+from typing import TypedDict
+
+from .const import TREND_WINDOW_SECONDS
+from .controller import GroupState
+
+NAN = float("nan")
+
+
+class HistorySummary(TypedDict):
+    """Downsampled series and trend figures for a group."""
+
+    samples: int
+    rate_of_change: float | None
+    time_to_setpoint: float | None
+    series: list[dict[str, str | float | None]]
+
+
+class GroupHistory:
+    """Fixed-size ring buffer of InletTemp/SetTemp/Drive samples.
+
+    Samples are stored in preallocated typed arrays (17 bytes per sample),
+    so memory use is fixed by the capacity and never grows. Missing
+    temperatures are stored as NaN.
+    """
+
+    __slots__ = ("capacity", "_time", "_inlet", "_set", "_drive", "_next", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the buffer."""
+        self.capacity = capacity
+        self._time = array("d", [0.0]) * capacity
+        self._inlet = array("f", [NAN]) * capacity
+        self._set = array("f", [NAN]) * capacity
+        self._drive = array("b", [0]) * capacity
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the sample arrays."""
+        return sum(
+            a.itemsize * len(a)
+            for a in (self._time, self._inlet, self._set, self._drive)
+        )
+
+    def append(self, timestamp: float, state: GroupState) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        i = self._next
+        self._time[i] = timestamp
+        self._inlet[i] = NAN if state.inlet_temp is None else state.inlet_temp
+        self._set[i] = NAN if state.set_temp is None else state.set_temp
+        self._drive[i] = state.drive == "ON"
+        self._next = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def _indices(self, since: float | None = None) -> list[int]:
+        """Return buffer indices in chronological order."""
+        start = (self._next - self._size) % self.capacity
+        indices = [(start + n) % self.capacity for n in range(self._size)]
+        if since is not None:
+            indices = [i for i in indices if self._time[i] >= since]
+        return indices
+
+    def samples(
+        self, since: float | None = None
+    ) -> Iterator[tuple[float, float | None, float | None, bool]]:
+        """Yield (timestamp, inlet_temp, set_temp, drive_on) samples."""
+        for i in self._indices(since):
+            yield (
+                self._time[i],
+                _none_if_nan(self._inlet[i]),
+                _none_if_nan(self._set[i]),
+                bool(self._drive[i]),
+            )
+
+    def downsample(
+        self, points: int, since: float | None = None
+    ) -> list[dict[str, str | float | None]]:
+        """Return at most points buckets of averaged samples.
+
+        Each bucket carries the time of its last sample, the mean inlet and
+        set temperatures and the share of samples with the unit on.
+        """
+        indices = self._indices(since)
+        if not indices or points < 1:
+            return []
+        size = math.ceil(len(indices) / points)
+        series: list[dict[str, str | float | None]] = []
+        for n in range(0, len(indices), size):
+            bucket = indices[n : n + size]
+            series.append(
+                {
+                    "time": datetime.fromtimestamp(
+                        self._time[bucket[-1]], UTC
+                    ).isoformat(),
+                    "inlet_temp": _mean(self._inlet[i] for i in bucket),
+                    "set_temp": _mean(self._set[i] for i in bucket),
+                    "drive_on": round(
+                        sum(self._drive[i] for i in bucket) / len(bucket), 3
+                    ),
+                }
+            )
+        return series
+
+    def rate_of_change(self, since: float) -> float | None:
+        """Return the inlet temperature trend in degrees per hour.
+
+        Least-squares slope over the samples taken since the given time.
+        """
+        points = [
+            (self._time[i], self._inlet[i])
+            for i in self._indices(since)
+            if not math.isnan(self._inlet[i])
+        ]
+        if len(points) < 2:
+            return None
+        t0 = points[0][0]
+        mean_t = sum(t - t0 for t, _ in points) / len(points)
+        mean_v = sum(v for _, v in points) / len(points)
+        var_t = sum((t - t0 - mean_t) ** 2 for t, _ in points)
+        if not var_t:
+            return None
+        cov = sum((t - t0 - mean_t) * (v - mean_v) for t, v in points)
+        return round(cov / var_t * 3600, 3)
+
+    def time_to_setpoint(self, since: float) -> float | None:
+        """Estimate minutes until the inlet temperature reaches the setpoint.
+
+        None when the unit is off, the trend points away from the setpoint
+        or there is not enough data.
+        """
+        if not self._size:
+            return None
+        last = (self._next - 1) % self.capacity
+        inlet = self._inlet[last]
+        target = self._set[last]
+        if not self._drive[last] or math.isnan(inlet) or math.isnan(target):
+            return None
+        rate = self.rate_of_change(since)
+        remaining = target - inlet
+        if not rate or remaining * rate <= 0:
+            return None
+        return round(remaining / rate * 60, 1)
+
+
+def _none_if_nan(value: float) -> float | None:
+    """Map NaN back to None."""
+    return None if math.isnan(value) else round(value, 2)
+
+
+def _mean(values: Iterator[float]) -> float | None:
+    """Average the non-NaN values."""
+    valid = [v for v in values if not math.isnan(v)]
+    if not valid:
+        return None
+    return round(sum(valid) / len(valid), 2)
+
+
+def summarize(
+    history: GroupHistory, now: float, window: float, points: int
+) -> HistorySummary:
+    """Return a downsampled series and trend figures for a group."""
+    return {
+        "samples": len(history),
+        "rate_of_change": history.rate_of_change(now - TREND_WINDOW_SECONDS),
+        "time_to_setpoint": history.time_to_setpoint(now - TREND_WINDOW_SECONDS),
+        "series": history.downsample(points, now - window),
+    }
@@ -0,0 +1,152 @@
+"""Opt-in profiler for the Mitsubishi AC poll and command paths."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import cProfile
+import io
+import pstats
+import time
+
+PHASES = ("build", "network", "parse", "dispatch")
+
+
+@dataclass
+class _Cycle:
+    """Wall time and summed phase times of one poll cycle."""
+
+    wall: float = 0.0
+    phases: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+
+class PollProfiler:
+    """cProfile plus per-phase wall time for a number of poll cycles.
+
+    Only exists while a profile is running; the controller and coordinator
+    skip all timing when they hold no profiler. cProfile is only enabled
+    while a poll cycle or a command runs, so the rest of Home Assistant
+    stays out of the dump except for what runs on the loop meanwhile.
+    """
+
+    def __init__(self, cycles: int) -> None:
+        """Initialize, failing early if another profiler is active."""
+        self.cycles = cycles
+        self.cycles_done = 0
+        self.phases: dict[str, list[float]] = defaultdict(list)
+        self.cycle_log: list[_Cycle] = []
+        self._profile = cProfile.Profile()
+        # Nested or overlapping profiled blocks; enabled while above zero
+        self._depth = 0
+        self._current: _Cycle | None = None
+        self._started = time.perf_counter()
+        self._elapsed = 0.0
+        self._profile.enable()
+        self._profile.disable()
+
+    @contextmanager
+    def profiling(self) -> Iterator[None]:
+        """Run cProfile for the duration of a block."""
+        if not self._depth:
+            try:
+                self._profile.enable()
+            except ValueError:
+                # Another profiler took over meanwhile; keep the timings
+                pass
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._profile.disable()
+
+    @contextmanager
+    def cycle(self) -> Iterator[None]:
+        """Profile and time one poll cycle."""
+        record = _Cycle()
+        self._current = record
+        start = time.perf_counter()
+        try:
+            with self.profiling():
+                yield
+        finally:
+            record.wall = time.perf_counter() - start
+            self._current = None
+            self.cycle_log.append(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block as one sample of a phase."""
+        record = self._current
+        if record is None and name == "dispatch" and self.cycle_log:
+            # Listeners are updated right after the cycle that polled
+            record = self.cycle_log[-1]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name].append(elapsed)
+            if record is not None:
+                record.phases[name] += elapsed
+
+    def cycle_done(self) -> bool:
+        """Count a finished poll; True when it was the last one."""
+        self.cycles_done += 1
+        return self.cycles_done == self.cycles
+
+    def stop(self) -> None:
+        """Stop collecting."""
+        self._profile.disable()
+        self._elapsed = time.perf_counter() - self._started
+
+    def summary(self) -> str:
+        """Return the per-phase and per-cycle summary and the top functions."""
+        lines = [
+            f"Profiled {self.cycles_done} poll cycles in {self._elapsed:.3f}s",
+            "",
+            f"{'phase':<10}{'calls':>8}{'total s':>12}{'mean ms':>12}{'max ms':>12}",
+        ]
+        names = [*PHASES, *(p for p in self.phases if p not in PHASES)]
+        for name in names:
+            samples = self.phases.get(name, [])
+            total = sum(samples)
+            mean = total / len(samples) if samples else 0.0
+            lines.append(
+                f"{name:<10}{len(samples):>8}{total:>12.4f}"
+                f"{mean * 1000:>12.3f}{max(samples, default=0.0) * 1000:>12.3f}"
+            )
+        # Concurrent requests overlap, so the phase sums of a cycle can
+        # exceed its wall time
+        lines.extend(
+            [
+                "",
+                f"{'cycle':<10}{'wall ms':>12}"
+                + "".join(f"{name + ' ms':>14}" for name in names),
+            ]
+        )
+        for n, record in enumerate(self.cycle_log, 1):
+            lines.append(
+                f"{n:<10}{record.wall * 1000:>12.3f}"
+                + "".join(
+                    f"{record.phases.get(name, 0.0) * 1000:>14.3f}"
+                    for name in names
+                )
+            )
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(30)
+        lines.extend(["", stream.getvalue()])
+        return "\n".join(lines)
+
+    def write(self, base_path: str) -> tuple[str, str]:
+        """Write the pstats dump and the summary; blocking."""
+        stats_path = f"{base_path}.prof"
+        summary_path = f"{base_path}.txt"
+        self._profile.dump_stats(stats_path)
+        with open(summary_path, "w", encoding="utf-8") as fh:
+            fh.write(self.summary())
+        return stats_path, summary_path
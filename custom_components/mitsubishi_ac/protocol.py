@@ -0,0 +1,34 @@
+"""Controller protocol constants shared with the standalone scripts.
+
+Standard library only, so capture_mitsubishi_ac.py can load this file
+without Home Assistant installed.
+"""
+
+# Mnet attributes polled for every group, unless the probe says otherwise
+POLL_ATTRS = ["Drive", "Mode", "SetTemp", "InletTemp"]
+# Mnet attributes polled only for groups that report them in the probe
+OPTIONAL_ATTRS = ["FanSpeed", "AirDirection", "FilterSign", "ErrorSign", "ErrorCode"]
+
+# Controller modes offered by every group
+BASE_MODES = ["COOL", "FAN"]
+# Optional controller modes and the Mnet switch that disables them
+MODE_SWITCHES = {
+    "HEAT": "HeatModeSW",
+    "DRY": "DryModeSW",
+    "AUTO": "AutoModeSW",
+}
+TEMP_MIN_ATTRS = ["CoolMin", "HeatMin"]
+TEMP_MAX_ATTRS = ["CoolMax", "HeatMax"]
+
+PROBE_ATTRS = [
+    *POLL_ATTRS,
+    *OPTIONAL_ATTRS,
+    "Model",
+    *MODE_SWITCHES.values(),
+    *TEMP_MIN_ATTRS,
+    *TEMP_MAX_ATTRS,
+]
+
+# Corpus files written by capture_mitsubishi_ac.py and read by replay.py
+CORPUS_FORMAT = "mitsubishi_ac-capture"
+CORPUS_VERSION = 1
@@ -0,0 +1,186 @@
+"""Replay transport serving captured controller traffic.
+
+The corpus is written by capture_mitsubishi_ac.py: a gzip file with one
+JSON object per line. The first line is a header, every following line is
+a request/response pair:
+
+    {"format": "mitsubishi_ac-capture", "version": 1, "host": ..., "t": ...}
+    {"t": 1767225600.12, "elapsed": 0.084, "request": "...", "response": "..."}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from .protocol import CORPUS_FORMAT, CORPUS_VERSION
+
+
+class ReplayMiss(aiohttp.ClientError):
+    """No captured response matches the request."""
+
+
+@dataclass
+class CapturedExchange:
+    """A single captured request/response pair."""
+
+    t: float
+    elapsed: float
+    request: str
+    response: str
+
+
+@dataclass
+class _Responses:
+    """Captured responses for one request key, replayed round-robin."""
+
+    exchanges: list[CapturedExchange] = field(default_factory=list)
+    index: int = 0
+
+    def next(self) -> CapturedExchange:
+        """Return the next captured exchange."""
+        exchange = self.exchanges[self.index % len(self.exchanges)]
+        self.index += 1
+        return exchange
+
+
+def _element_key(element: ET.Element) -> str:
+    """Build an order-insensitive signature of an element and its children."""
+    attrs = ",".join(f"{k}={v}" for k, v in sorted(element.attrib.items()))
+    children = "".join(_element_key(child) for child in element)
+    return f"<{element.tag}[{attrs}]{children}>"
+
+
+def request_key(xml_text: str) -> str:
+    """Return a canonical key for a request packet.
+
+    Packets built by ElementTree (check_mitsubishi_ac.py) and by f-strings
+    (controller.py) differ in spacing and attribute order; both map to the
+    same key.
+    """
+    root = ET.fromstring(xml_text)
+    command = (root.findtext("Command") or "").strip()
+    manager = root.find("DatabaseManager")
+    body = "" if manager is None else _element_key(manager)
+    return f"{command}:{body}"
+
+
+def load_corpus(path: str) -> list[CapturedExchange]:
+    """Load captured exchanges from a corpus file."""
+    exchanges: list[CapturedExchange] = []
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        header = json.loads(fh.readline())
+        if header.get("format") != CORPUS_FORMAT:
+            raise ValueError(f"{path} is not a {CORPUS_FORMAT} corpus")
+        if header.get("version") != CORPUS_VERSION:
+            raise ValueError(
+                f"Unsupported corpus version {header.get('version')!r}"
+            )
+        for line in fh:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            exchanges.append(
+                CapturedExchange(
+                    t=record["t"],
+                    elapsed=record.get("elapsed", 0.0),
+                    request=record["request"],
+                    response=record["response"],
+                )
+            )
+    return exchanges
+
+
+class ReplayTransport:
+    """Transport for MitsubishiACController that answers from a corpus.
+
+    Requests are matched on their canonical key. Repeated captures of the
+    same request are returned in capture order, wrapping around. Mnet
+    getRequests that were not captured verbatim are answered from the
+    latest captured value of each attribute for that group, so polls with
+    a different attribute set still replay. setRequests are acknowledged
+    without changing anything.
+
+    By default responses are returned immediately; with realtime=True each
+    response is delayed by the round-trip time measured during capture.
+    """
+
+    def __init__(
+        self, exchanges: list[CapturedExchange], realtime: bool = False
+    ) -> None:
+        """Initialize the transport."""
+        self._realtime = realtime
+        self._responses: dict[str, _Responses] = {}
+        self._mnet_attrs: dict[str, dict[str, str]] = {}
+        self.requests = 0
+        self.misses = 0
+        for exchange in exchanges:
+            key = request_key(exchange.request)
+            self._responses.setdefault(key, _Responses()).exchanges.append(
+                exchange
+            )
+            self._index_mnet(exchange.response)
+
+    @classmethod
+    def from_file(cls, path: str, realtime: bool = False) -> ReplayTransport:
+        """Create a transport from a corpus file."""
+        return cls(load_corpus(path), realtime=realtime)
+
+    def _index_mnet(self, response: str) -> None:
+        """Remember the latest value of every Mnet attribute per group."""
+        try:
+            root = ET.fromstring(response)
+        except ET.ParseError:
+            return
+        for mnet in root.iter("Mnet"):
+            group = mnet.get("Group")
+            if group is not None:
+                self._mnet_attrs.setdefault(group, {}).update(mnet.attrib)
+
+    def _synthesize(self, data: str) -> str | None:
+        """Answer a request that was not captured verbatim, if possible."""
+        root = ET.fromstring(data)
+        command = (root.findtext("Command") or "").strip()
+        manager = root.find("DatabaseManager")
+        if manager is None or not len(manager):
+            return None
+        if command == "setRequest":
+            root.find("Command").text = "setResponse"
+            return ET.tostring(root, encoding="unicode")
+        if command != "getRequest":
+            return None
+        for element in manager:
+            if element.tag != "Mnet":
+                return None
+            known = self._mnet_attrs.get(element.get("Group", ""))
+            if known is None:
+                return None
+            for name, value in list(element.attrib.items()):
+                if value != "*":
+                    continue
+                if name in known:
+                    element.set(name, known[name])
+                else:
+                    del element.attrib[name]
+        root.find("Command").text = "getResponse"
+        return ET.tostring(root, encoding="unicode")
+
+    async def __call__(self, data: str) -> str:
+        """Return the captured response for a request packet."""
+        self.requests += 1
+        responses = self._responses.get(request_key(data))
+        if responses is None:
+            response = self._synthesize(data)
+            if response is None:
+                self.misses += 1
+                raise ReplayMiss(f"No captured response for {data}")
+            return response
+        exchange = responses.next()
+        if self._realtime and exchange.elapsed > 0:
+            await asyncio.sleep(exchange.elapsed)
+        return exchange.response
@@ -0,0 +1,110 @@
+"""Sensor platform for Mitsubishi AC."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .controller import GroupState
+from .coordinator import MitsubishiACCoordinator
+from .entity import MitsubishiACEntity
+
+FAN_SPEEDS = ["low", "mid2", "mid1", "high", "auto"]
+AIR_DIRECTIONS = ["swing", "vertical", "mid2", "mid1", "horizontal", "auto"]
+
+
+def _enum_value(value: str | None, options: list[str]) -> str | None:
+    """Map a controller value onto an enum sensor option."""
+    if value is None:
+        return None
+    value = value.lower()
+    return value if value in options else None
+
+
+@dataclass(frozen=True, kw_only=True)
+class MitsubishiACSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor read from a polled Mnet attribute."""
+
+    attribute: str
+    value_fn: Callable[[GroupState], str | None]
+
+
+SENSORS: tuple[MitsubishiACSensorEntityDescription, ...] = (
+    MitsubishiACSensorEntityDescription(
+        key="fan_speed",
+        translation_key="fan_speed",
+        device_class=SensorDeviceClass.ENUM,
+        options=FAN_SPEEDS,
+        attribute="FanSpeed",
+        value_fn=lambda state: _enum_value(state.fan_speed, FAN_SPEEDS),
+    ),
+    MitsubishiACSensorEntityDescription(
+        key="air_direction",
+        translation_key="air_direction",
+        device_class=SensorDeviceClass.ENUM,
+        options=AIR_DIRECTIONS,
+        attribute="AirDirection",
+        value_fn=lambda state: _enum_value(state.air_direction, AIR_DIRECTIONS),
+    ),
+    MitsubishiACSensorEntityDescription(
+        key="error_code",
+        translation_key="error_code",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        attribute="ErrorCode",
+        value_fn=lambda state: state.error_code,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up sensor entities from a config entry."""
+    coordinator: MitsubishiACCoordinator = entry.runtime_data
+    entities = [
+        MitsubishiACSensor(coordinator, group, name, description)
+        for group, name in coordinator.groups.items()
+        for description in SENSORS
+        if description.attribute
+        in coordinator.capabilities.for_group(group).attributes
+    ]
+    async_add_entities(entities)
+
+
+class MitsubishiACSensor(MitsubishiACEntity, SensorEntity):
+    """Sensor for a single attribute of a Mitsubishi AC group."""
+
+    entity_description: MitsubishiACSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: MitsubishiACCoordinator,
+        group: str,
+        name: str,
+        description: MitsubishiACSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, group, name)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{group}_{description.key}"
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the attribute value."""
+        state = self._state
+        if state is None:
+            return None
+        return self.entity_description.value_fn(state)
@@ -0,0 +1,148 @@
+"""Services for the Mitsubishi AC integration."""
+
+from __future__ import annotations
+
+import time
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from .const import CONF_CAPABILITIES, DOMAIN, HISTORY_CAPACITY
+from .coordinator import MitsubishiACCoordinator
+from .entity import device_identifier
+from .history import summarize
+
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_REFRESH_CAPABILITIES = "refresh_capabilities"
+SERVICE_PROFILE = "profile"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_HOURS = "hours"
+ATTR_POINTS = "points"
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+        vol.Optional(ATTR_HOURS, default=24): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=24)
+        ),
+        vol.Optional(ATTR_POINTS, default=96): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=HISTORY_CAPACITY)
+        ),
+    }
+)
+
+REFRESH_CAPABILITIES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=5): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+
+def _get_entry(hass: HomeAssistant, entry_id: str) -> ConfigEntry:
+    """Return a Mitsubishi AC config entry by id."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(f"{entry_id} is not a Mitsubishi AC entry")
+    return entry
+
+
+def _resolve_group(
+    hass: HomeAssistant, entity_id: str
+) -> tuple[MitsubishiACCoordinator, str]:
+    """Find the coordinator and group behind an entity of an AC group."""
+    entity = er.async_get(hass).async_get(entity_id)
+    if entity is None or entity.platform != DOMAIN:
+        raise ServiceValidationError(
+            f"{entity_id} is not a Mitsubishi AC entity"
+        )
+    entry = hass.config_entries.async_get_entry(entity.config_entry_id or "")
+    if entry is None or entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"{entity_id} is not loaded")
+    coordinator: MitsubishiACCoordinator = entry.runtime_data
+    device = dr.async_get(hass).async_get(entity.device_id or "")
+    if device is not None:
+        for group in coordinator.groups:
+            if device_identifier(entry.entry_id, group) in device.identifiers:
+                return coordinator, group
+    raise ServiceValidationError(f"{entity_id} does not belong to an AC group")
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Return the downsampled history of a group."""
+        entity_id = call.data[ATTR_ENTITY_ID]
+        coordinator, group = _resolve_group(hass, entity_id)
+        return {
+            "entity_id": entity_id,
+            "group": group,
+            **summarize(
+                coordinator.history[group],
+                time.time(),
+                call.data[ATTR_HOURS] * 3600,
+                call.data[ATTR_POINTS],
+            ),
+        }
+
+    async def async_refresh_capabilities(call: ServiceCall) -> None:
+        """Drop the cached capabilities and reload to probe again."""
+        entry = _get_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        data = {k: v for k, v in entry.data.items() if k != CONF_CAPABILITIES}
+        hass.config_entries.async_update_entry(entry, data=data)
+        await hass.config_entries.async_reload(entry.entry_id)
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next poll cycles of a controller."""
+        entry = _get_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        if entry.state is not ConfigEntryState.LOADED:
+            raise ServiceValidationError(f"{entry.title} is not loaded")
+        coordinator: MitsubishiACCoordinator = entry.runtime_data
+        coordinator.async_start_profile(call.data[ATTR_CYCLES])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_CAPABILITIES,
+        async_refresh_capabilities,
+        schema=REFRESH_CAPABILITIES_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+    )
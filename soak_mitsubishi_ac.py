@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""Load and soak test for the Mitsubishi AC integration.
+
+Runs the real MitsubishiACCoordinator and MitsubishiACClimate entities,
+added to an entity platform of a bare Home Assistant core so every update
+goes through the state machine and the event bus, against simulated
+controllers, for as long as requested, and reports:
+
+- event-loop lag (how late a 50 ms timer fires)
+- memory growth since the end of warm-up
+- controller requests per second
+- p50/p99 latency from a set_temperature command to the state_changed
+  event carrying the new target temperature
+
+Must be run from the repository root with Home Assistant installed:
+
+    python3 soak_mitsubishi_ac.py --controllers 8 --groups 50 --duration 14400
+"""
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from datetime import timedelta
+import json
+import logging
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import aiohttp
+
+from homeassistant.const import ATTR_TEMPERATURE, EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity as entity_helper, entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
+from homeassistant.loader import async_setup as async_setup_loader
+
+from custom_components.mitsubishi_ac.climate import MitsubishiACClimate
+from custom_components.mitsubishi_ac.const import (
+    CONF_GROUP_TIMEOUT,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_GROUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DOMAIN,
+)
+from custom_components.mitsubishi_ac.controller import MitsubishiACController
+from custom_components.mitsubishi_ac.coordinator import MitsubishiACCoordinator
+
+LAG_TICK = 0.05
+
+
+class SimulatedController:
+    """Transport answering like a controller with a number of AC groups."""
+
+    def __init__(
+        self, groups, latency, jitter, failure_rate, change_rate, multi_mnet=True
+    ):
+        self.latency = latency
+        self.multi_mnet = multi_mnet
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.change_rate = change_rate
+        self.requests = 0
+        self.failures = 0
+        self.groups = {
+            str(g): {
+                "Drive": "ON",
+                "Mode": "COOL",
+                "SetTemp": "22.0",
+                "InletTemp": f"{random.uniform(20, 28):.1f}",
+                "FanSpeed": "AUTO",
+                "AirDirection": "SWING",
+                "FilterSign": "OFF",
+                "ErrorSign": "OFF",
+                "ErrorCode": "8000",
+                "Model": "IC",
+                "CoolMin": "16.0",
+                "CoolMax": "31.0",
+                "HeatMin": "16.0",
+                "HeatMax": "31.0",
+            }
+            for g in range(1, groups + 1)
+        }
+
+    def _drift(self, state):
+        """Move the inlet temperature towards the setpoint now and then."""
+        if random.random() >= self.change_rate:
+            return
+        inlet = float(state["InletTemp"])
+        target = float(state["SetTemp"]) if state["Drive"] == "ON" else 26.0
+        step = 0.5 if target > inlet else -0.5
+        state["InletTemp"] = f"{inlet + step:.1f}"
+
+    async def __call__(self, data):
+        self.requests += 1
+        await asyncio.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+        if random.random() < self.failure_rate:
+            self.failures += 1
+            raise aiohttp.ClientError("Simulated controller failure")
+
+        root = ET.fromstring(data)
+        command = root.find("Command")
+        manager = root.find("DatabaseManager")
+        if command.text == "setRequest":
+            for mnet in manager.iter("Mnet"):
+                self.groups[mnet.get("Group")].update(
+                    (k, v) for k, v in mnet.attrib.items() if k != "Group"
+                )
+            command.text = "setResponse"
+        else:
+            if not self.multi_mnet:
+                # Old firmware: only the first Mnet element is answered
+                for extra in manager.findall("Mnet")[1:]:
+                    manager.remove(extra)
+            for element in manager.iter():
+                if element.tag == "MnetList":
+                    for group in self.groups:
+                        ET.SubElement(
+                            element,
+                            "MnetRecord",
+                            Group=group,
+                            GroupNameWeb=f"GROUP {group}",
+                        )
+                elif element.tag == "Mnet":
+                    state = self.groups[element.get("Group")]
+                    self._drift(state)
+                    for name, value in list(element.attrib.items()):
+                        if value != "*":
+                            continue
+                        if name in state:
+                            element.set(name, state[name])
+                        else:
+                            del element.attrib[name]
+                elif element.tag == "SystemData":
+                    element.attrib.update(
+                        Version="7.60", TempUnit="C", Model="AE-200"
+                    )
+            command.text = "getResponse"
+        return ET.tostring(root, encoding="unicode")
+
+
+@dataclass
+class _SoakEntry:
+    """Stand-in for the config entry the coordinator and entities read."""
+
+    entry_id: str
+    options: dict = field(default_factory=dict)
+    pref_disable_polling: bool = False
+
+
+class Metrics:
+    """Collects the measurements of one reporting window."""
+
+    def __init__(self):
+        self.lags = []
+        self.command_latencies = []
+        self.commands = 0
+        self.state_changes = 0
+
+    @staticmethod
+    def percentile(values, pct):
+        if not values:
+            return None
+        if len(values) == 1:
+            return values[0]
+        return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def memory_bytes():
+    """Return the current Python heap (tracemalloc) or process RSS."""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss is the peak, in KiB on Linux and bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+
+class Soak:
+    """Wires simulated controllers, coordinators and entities together."""
+
+    def __init__(self, hass, args):
+        self.hass = hass
+        self.args = args
+        self.metrics = Metrics()
+        self.sims = []
+        self.coordinators = []
+        self.entities = []
+        # entity_id -> (target temperature, time the command was sent)
+        self.pending = {}
+
+    async def setup(self):
+        await er.async_load(self.hass)
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._on_state_changed)
+        for c in range(self.args.controllers):
+            sim = SimulatedController(
+                self.args.groups,
+                self.args.latency / 1000,
+                self.args.jitter / 1000,
+                0.0,
+                self.args.change_rate,
+                multi_mnet=not self.args.no_multi_mnet,
+            )
+            controller = MitsubishiACController(f"sim{c}", transport=sim)
+            async with aiohttp.ClientSession() as session:
+                groups = {
+                    g.group: g.name
+                    for g in await controller.async_discover_groups(session)
+                }
+                capabilities = await controller.async_probe_capabilities(
+                    session,
+                    list(groups),
+                    self.args.max_concurrency,
+                    self.args.group_timeout,
+                )
+            coordinator = MitsubishiACCoordinator(
+                self.hass, controller, groups, capabilities
+            )
+            coordinator.config_entry = _SoakEntry(
+                f"soak{c}",
+                options={
+                    CONF_MAX_CONCURRENCY: self.args.max_concurrency,
+                    CONF_GROUP_TIMEOUT: self.args.group_timeout,
+                },
+            )
+            coordinator.update_interval = timedelta(
+                seconds=self.args.scan_interval
+            )
+            await coordinator.async_refresh()
+            entities = []
+            for group, name in groups.items():
+                entity = MitsubishiACClimate(coordinator, group, name)
+                entity.entity_id = f"climate.soak_{c}_{group}"
+                # Every simulated controller numbers its groups from 1
+                entity._attr_unique_id = f"soak{c}_{group}"
+                entities.append(entity)
+            platform = EntityPlatform(
+                hass=self.hass,
+                logger=logging.getLogger(__name__),
+                domain="climate",
+                platform_name=DOMAIN,
+                platform=None,
+                scan_interval=coordinator.update_interval,
+                entity_namespace=None,
+            )
+            await platform.async_add_entities(entities)
+            # Failures only start once setup went through
+            sim.failure_rate = self.args.failure_rate
+            self.sims.append(sim)
+            self.coordinators.append(coordinator)
+            self.entities.extend(entities)
+
+    @callback
+    def _on_state_changed(self, event):
+        """Count state writes and match them against pending commands."""
+        self.metrics.state_changes += 1
+        new_state = event.data["new_state"]
+        pending = self.pending.get(event.data["entity_id"])
+        if (
+            pending
+            and new_state is not None
+            and new_state.attributes.get(ATTR_TEMPERATURE) == pending[0]
+        ):
+            self.metrics.command_latencies.append(
+                time.perf_counter() - pending[1]
+            )
+            del self.pending[event.data["entity_id"]]
+
+    async def measure_lag(self):
+        while True:
+            t0 = time.perf_counter()
+            await asyncio.sleep(LAG_TICK)
+            self.metrics.lags.append(time.perf_counter() - t0 - LAG_TICK)
+
+    async def send_commands(self):
+        if self.args.commands_per_minute <= 0:
+            return
+        interval = 60 / self.args.commands_per_minute
+        while True:
+            await asyncio.sleep(random.expovariate(1 / interval))
+            entity = random.choice(self.entities)
+            current = entity.target_temperature or 22.0
+            target = random.choice(
+                [t / 2 for t in range(36, 57) if t / 2 != current]
+            )
+            self.pending[entity.entity_id] = (target, time.perf_counter())
+            self.metrics.commands += 1
+            self.hass.async_create_task(self._command(entity, target))
+
+    async def _command(self, entity, target):
+        try:
+            await entity.async_set_temperature(temperature=target)
+        except aiohttp.ClientError:
+            # Simulated failure; the command is lost like on a real site
+            self.pending.pop(entity.entity_id, None)
+
+    def report(self, elapsed, window, baseline_memory):
+        m = self.metrics
+        requests = sum(sim.requests for sim in self.sims)
+        failures = sum(sim.failures for sim in self.sims)
+        hits = sum(c.controller.fingerprint_hits for c in self.coordinators)
+        misses = sum(c.controller.fingerprint_misses for c in self.coordinators)
+        memory = memory_bytes()
+        p50 = m.percentile(m.command_latencies, 50)
+        p99 = m.percentile(m.command_latencies, 99)
+        row = {
+            "elapsed_s": round(elapsed, 1),
+            "loop_lag_p99_ms": round((m.percentile(m.lags, 99) or 0) * 1000, 2),
+            "loop_lag_max_ms": round(max(m.lags, default=0) * 1000, 2),
+            "memory_mb": round(memory / 2**20, 2),
+            "memory_growth_mb": round((memory - baseline_memory) / 2**20, 2),
+            "requests_per_s": round((requests - self._last_requests) / window, 2),
+            "failures": failures,
+            "state_changes": m.state_changes,
+            "commands": m.commands,
+            "commands_applied": len(m.command_latencies),
+            "command_p50_s": None if p50 is None else round(p50, 3),
+            "command_p99_s": None if p99 is None else round(p99, 3),
+            "fingerprint_hit_ratio": (
+                round(hits / (hits + misses), 3) if hits + misses else None
+            ),
+        }
+        self._last_requests = requests
+        self.metrics = Metrics()
+        return row
+
+    async def run(self):
+        args = self.args
+        await self.setup()
+        tasks = [
+            asyncio.create_task(self.measure_lag()),
+            asyncio.create_task(self.send_commands()),
+        ]
+        print(
+            f"{args.controllers} controllers x {args.groups} groups, "
+            f"warm-up {args.warmup}s, duration {args.duration}s",
+            file=sys.stderr,
+        )
+        await asyncio.sleep(args.warmup)
+        self.metrics = Metrics()
+        self._last_requests = sum(sim.requests for sim in self.sims)
+        baseline_memory = memory_bytes()
+
+        rows = []
+        start = time.perf_counter()
+        last = start
+        while (now := time.perf_counter()) - start < args.duration:
+            await asyncio.sleep(min(args.report_interval, args.duration))
+            now = time.perf_counter()
+            row = self.report(now - start, now - last, baseline_memory)
+            last = now
+            rows.append(row)
+            print(json.dumps(row))
+
+        for task in tasks:
+            task.cancel()
+        for coordinator in self.coordinators:
+            await coordinator.async_shutdown()
+        return rows
+
+
+def summarize(rows):
+    """Summarize a run; regressions show up as drifting memory or lag."""
+    if not rows:
+        return {}
+    latencies = [r["command_p99_s"] for r in rows if r["command_p99_s"]]
+    return {
+        "duration_s": rows[-1]["elapsed_s"],
+        "loop_lag_max_ms": max(r["loop_lag_max_ms"] for r in rows),
+        "memory_growth_mb": rows[-1]["memory_growth_mb"],
+        "requests_per_s": round(
+            statistics.mean(r["requests_per_s"] for r in rows), 2
+        ),
+        "command_p99_worst_s": max(latencies) if latencies else None,
+        "commands": sum(r["commands"] for r in rows),
+        "commands_applied": sum(r["commands_applied"] for r in rows),
+    }
+
+
+async def soak(args):
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # The parts of bootstrap that adding entities to a platform needs
+        async_setup_loader(hass)
+        entity_helper.async_setup(hass)
+        rows = await Soak(hass, args).run()
+        await hass.async_stop(force=True)
+    summary = summarize(rows)
+    print(json.dumps({"summary": summary}))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"args": vars(args), "rows": rows, "summary": summary}, fh)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog=__file__)
+    parser.add_argument("--controllers", type=int, default=1)
+    parser.add_argument("--groups", type=int, default=50, help="Groups per controller")
+    parser.add_argument("--duration", type=float, default=3600, help="Seconds to run after warm-up")
+    parser.add_argument("--warmup", type=float, default=60, help="Seconds before measuring")
+    parser.add_argument("--scan-interval", type=float, default=30, help="Poll interval in seconds")
+    parser.add_argument("--latency", type=float, default=80, help="Mean controller latency in ms")
+    parser.add_argument("--jitter", type=float, default=20, help="Latency standard deviation in ms")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument("--change-rate", type=float, default=0.1, help="Share of group reads where the temperature moves")
+    parser.add_argument("--commands-per-minute", type=float, default=6, help="set_temperature calls per minute, all controllers")
+    parser.add_argument("--report-interval", type=float, default=60, help="Seconds between report rows")
+    parser.add_argument("--no-multi-mnet", action="store_true", help="Simulate firmware that answers only one Mnet per request")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY, help="Concurrent per-group requests")
+    parser.add_argument("--group-timeout", type=float, default=DEFAULT_GROUP_TIMEOUT, help="Per-group request timeout in seconds")
+    parser.add_argument("--tracemalloc", action="store_true", help="Track Python heap instead of RSS")
+    parser.add_argument("--output", help="Write rows and summary to this JSON file")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    if args.tracemalloc:
+        tracemalloc.start()
+    sys.exit(asyncio.run(soak(args)))
+
+
+if __name__ == "__main__":
+    main()